@@ -23,31 +23,167 @@ __all__ = ["MTAirCompressorCsc", "run_mtaircompressor"]
 
 import argparse
 import asyncio
+import collections
 import typing
 
 import pymodbus.exceptions
 from lsst.ts import salobj, utils
 from pymodbus.client.tcp import AsyncModbusTcpClient as ModbusClient
-from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder
 from pymodbus.server.async_io import ModbusTcpServer
 
 from . import __version__
-from .aircompressor_model import MTAirCompressorModel
+from .aircompressor_model import (
+    ERROR_E400_ADDRESS,
+    RUNNING_HOURS_ADDRESS,
+    STATUS_ADDRESS,
+    WATER_LEVEL_ADDRESS,
+    MTAirCompressorModel,
+)
 from .config_schema import CONFIG_SCHEMA
 from .enums import ErrorCode
 from .simulator import create_server_and_run_on_background
-from .utils import status_bit_to_bools
+from .utils import (
+    bit_masks,
+    reconnect_delay,
+    registers_to_string,
+    to_int16,
+    to_uint32,
+    update_bools,
+)
 
 """Telemetry period. Telemetry shall be reported every n seconds."""
 POLL_PERIOD = 1
 
-"""Sleep for this number of seconds before reconnecting."""
+"""Timers period. Timers shall be reported every n seconds."""
+TIMER_PERIOD = 60
+
+"""Sleep for this number of seconds before reconnecting. Doubled with every
+failed attempt, up to SLEEP_RECONNECT_MAX."""
 SLEEP_RECONNECT = 5
 
+"""Maximal number of seconds to sleep before reconnecting."""
+SLEEP_RECONNECT_MAX = 60
+
 """Sleep for this number of seconds after catching an exception."""
 SLEEP_EXCEPTION = 2
 
+# Bits of status registers (0x30 and 0x32), lowest first
+STATUS_MASKS = bit_masks(
+    [
+        "readyToStart",
+        "operating",
+        "startInhibit",
+        "motorStartPhase",
+        "offLoad",
+        "onLoad",
+        "softStop",
+        "runOnTimer",
+        "fault",
+        "warning",
+        "serviceRequired",
+        "minAllowedSpeedAchieved",
+        "maxAllowedSpeedAchieved",
+    ]
+)
+START_MASKS = bit_masks(
+    [
+        "startByRemote",
+        "startWithTimerControl",
+        "startWithPressureRequirement",
+        "startAfterDePressurise",
+        "startAfterPowerLoss",
+        "startAfterDryerPreRun",
+    ]
+)
+
+# Bits of error registers (0x63, 0x64 and 0x69), lowest first
+ERROR_E400_MASKS = bit_masks(
+    [
+        "powerSupplyFailureE400",
+        "emergencyStopActivatedE401",
+        "highMotorTemperatureM1E402",
+        "compressorDischargeTemperatureE403",
+        "startTemperatureLowE404",
+        "dischargeOverPressureE405",
+        "linePressureSensorB1E406",
+        "dischargePressureSensorB2E407",
+        "dischargeTemperatureSensorR2E408",
+        "controllerHardwareE409",
+        "coolingE410",
+        "oilPressureLowE411",
+        "externalFaultE412",
+        "dryerE413",
+        "condensateDrainE414",
+        "noPressureBuildUpE415",
+    ]
+)
+ERROR_E416_MASKS = bit_masks(["heavyStartupE416"])
+ERROR_E500_MASKS = bit_masks(
+    [
+        "preAdjustmentVSDE500",
+        "preAdjustmentE501",
+        "lockedVSDE502",
+        "writeFaultVSDE503",
+        "communicationVSDE504",
+        "stopPressedVSDE505",
+        "stopInputEMVSDE506",
+        "readFaultVSDE507",
+        "stopInputVSDEME508",
+        "seeVSDDisplayE509",
+        "speedBelowMinLimitE510",
+    ]
+)
+
+# Bits of warning registers (0x6B, 0x6C and 0x71), lowest first
+WARNING_A600_MASKS = bit_masks(
+    [
+        "serviceDueA600",
+        "dischargeOverPressureA601",
+        "compressorDischargeTemperatureA602",
+        None,
+        None,
+        None,
+        "linePressureHighA606",
+        "controllerBatteryEmptyA607",
+        "dryerA608",
+        "condensateDrainA609",
+        "fineSeparatorA610",
+        "airFilterA611",
+        "oilFilterA612",
+        "oilLevelLowA613",
+        "oilTemperatureHighA614",
+        "externalWarningA615",
+    ]
+)
+WARNING_A616_MASKS = bit_masks(
+    [
+        "motorLuricationSystemA616",
+        "input1A617",
+        "input2A618",
+        "input3A619",
+        "input4A620",
+        "input5A621",
+        "input6A622",
+        "fullSDCardA623",
+    ]
+)
+WARNING_A700_MASKS = bit_masks(["temperatureHighVSDA700"])
+
+# All fields of status, errors and warnings events. Copied to get presized
+# maps for decoding
+STATUS_FIELDS = dict.fromkeys([field for field, _ in STATUS_MASKS + START_MASKS], False)
+ERRORS_FIELDS = dict.fromkeys(
+    [field for field, _ in ERROR_E400_MASKS + ERROR_E416_MASKS + ERROR_E500_MASKS],
+    False,
+)
+WARNINGS_FIELDS = dict.fromkeys(
+    [
+        field
+        for field, _ in WARNING_A600_MASKS + WARNING_A616_MASKS + WARNING_A700_MASKS
+    ],
+    False,
+)
+
 
 class MTAirCompressorCsc(salobj.ConfigurableCsc):
     """MTAirCompressor CsC
@@ -109,8 +245,23 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         # poll_loop to report time waiting for reconnection. None when not
         # failed, TAI when failure was firstly detected
         self._failed_tai: float | None = None
+        # True after compressor info was published. Info cannot change while
+        # the compressor is connected, so it isn't read again on reconnection
+        self._compressor_info_published = False
+        # Number of failed reconnection attempts since connection was lost
+        self._reconnect_attempt = 0
+        # Raw status and error registers last published. Used to skip
+        # decoding and publishing of unchanged values, None forces publishing
+        self._last_status: list[int] | None = None
+        self._last_errors_warnings: list[int] | None = None
 
         self.poll_task = utils.make_done_future()
+        # Publishes timers, runs while telemetry_loop runs
+        self.timer_task = utils.make_done_future()
+        # Last timer registers read by telemetry_loop
+        self._timers: list[int] = []
+        # Set when poll_task shall end
+        self._shutdown_event = asyncio.Event()
 
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
@@ -151,18 +302,25 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         cls.unit = args.unit
 
     async def configure(self, config: typing.Any) -> None:
-        instance = [i for i in config.instances if i["sal_index"] == self.salinfo.index]
-        if len(instance) == 0:
+        instances_by_index = {i["sal_index"]: i for i in config.instances}
+        if len(instances_by_index) != len(config.instances):
+            duplicates = [
+                index
+                for index, count in collections.Counter(
+                    i["sal_index"] for i in config.instances
+                ).items()
+                if count > 1
+            ]
             raise RuntimeError(
-                f"Cannot find configuration for index {self.salinfo.index},"
-                "at least sal_index entry must be provided"
+                f"Multiple configuration instances have sal_index {duplicates},"
+                " please check configuration file"
             )
-        elif len(instance) > 1:
+        our_instance = instances_by_index.get(self.salinfo.index)
+        if our_instance is None:
             raise RuntimeError(
-                f"Multiple configuration instances matches index {self.salinfo.index},"
-                "please check configuration file"
+                f"Cannot find configuration for index {self.salinfo.index},"
+                " at least sal_index entry must be provided"
             )
-        our_instance = instance[0]
         if self.grace_period is None:
             self.grace_period = our_instance.get("grace_period", 3600)
         if self.host is None:
@@ -179,11 +337,20 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         return "ts_config_mttcs"
 
     async def _close_own_tasks(self) -> None:
+        self._shutdown_event.set()
+        self.poll_task.cancel()
+        self.timer_task.cancel()
+        # wait for poll_task to finish, so the connection isn't closed while
+        # it's reading from it
+        await asyncio.gather(self.poll_task, return_exceptions=True)
         if self.simulation_mode == 1 and self.simulator is not None:
             await self.simulator.shutdown()
             self.simulator_task.cancel()
-        self.poll_task.cancel()
         await self.disconnect()
+        # host and port can change before the next start
+        self.connection = None
+        self._compressor_info_published = False
+        self._reconnect_attempt = 0
 
     async def close_tasks(self) -> None:
         await self._close_own_tasks()
@@ -227,23 +394,31 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         self._failed_tai = None
 
     async def connect(self) -> None:
+        # the client is kept on disconnect, so reconnection after a network
+        # failure reuses it
         if self.connection is None:
             self.connection = ModbusClient(host=self.host, port=self.port)
-        assert self.connection is not None
-        await self.connection.connect()
+        if not self.connection.connected:
+            # connect returns False on failure, doesn't raise
+            if not await self.connection.connect():
+                raise pymodbus.exceptions.ConnectionException(
+                    f"Cannot connect to {self.host}:{self.port}"
+                )
         if self.model is None:
             assert self.unit is not None
             self.model = MTAirCompressorModel(self.connection, self.unit)
         await self.evt_connectionStatus.set_write(connected=True)
-        await self.update_compressor_info()
+        if not self._compressor_info_published:
+            await self.update_compressor_info()
         self.log.info(f"Connected to {self.host}:{self.port}")
 
     async def disconnect(self) -> None:
         await self.evt_connectionStatus.set_write(connected=False)
         self.model = None
+        self._last_status = None
+        self._last_errors_warnings = None
         if self.connection is not None:
             self.connection.close()
-            self.connection = None
 
     async def end_start(self, data: salobj.type_hints.BaseMsgType) -> None:
         """Enables communication with the compressor."""
@@ -260,6 +435,7 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         try:
             await self.connect()
             if self.poll_task.done():
+                self._shutdown_event.clear()
                 self.poll_task = asyncio.create_task(self.poll_loop())
         except (
             pymodbus.exceptions.ModbusException,
@@ -275,250 +451,188 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         self.log.error(msg)
         raise salobj.ExpectedError(msg)
 
-    async def do_reset(self, data: salobj.type_hints.BaseMsgType) -> None:
-        """Reset compressor faults."""
+    async def _run_command(
+        self,
+        command: typing.Callable[[MTAirCompressorModel], typing.Awaitable],
+        success_msg: str,
+        error_msg: str,
+    ) -> None:
+        """Run compressor command. Modbus errors are reported as
+        `salobj.ExpectedError`.
+
+        Parameters
+        ----------
+        command : `callable`
+            MTAirCompressorModel method to call.
+        success_msg : `str`
+            Message logged after command succeeded.
+        error_msg : `str`
+            Message prefix for command failure.
+        """
         self.assert_enabled()
         try:
             assert self.model is not None
-            await self.model.reset()
-            self.log.info("Compressor reset.")
+            await command(self.model)
+            self.log.info(success_msg)
         except (
             pymodbus.exceptions.ModbusException,
             asyncio.TimeoutError,
         ) as ex:
-            self._expected_error(f"Cannot reset compressor: {str(ex)}")
+            self._expected_error(f"{error_msg}: {str(ex)}")
+
+    async def do_reset(self, data: salobj.type_hints.BaseMsgType) -> None:
+        """Reset compressor faults."""
+        await self._run_command(
+            MTAirCompressorModel.reset, "Compressor reset.", "Cannot reset compressor"
+        )
 
     async def do_powerOn(self, data: salobj.type_hints.BaseMsgType) -> None:
         """Powers on compressor."""
-        self.assert_enabled()
-        try:
-            assert self.model is not None
-            await self.model.power_on()
-            self.log.info("Compressor powered on.")
-        except (
-            pymodbus.exceptions.ModbusException,
-            asyncio.TimeoutError,
-        ) as ex:
-            self._expected_error(f"Cannot power on compressor: {str(ex)}")
+        await self._run_command(
+            MTAirCompressorModel.power_on,
+            "Compressor powered on.",
+            "Cannot power on compressor",
+        )
 
     async def do_powerOff(self, data: salobj.type_hints.BaseMsgType) -> None:
-        self.assert_enabled()
-        try:
-            assert self.model is not None
-            await self.model.power_off()
-            self.log.info("Compressor powered off.")
-        except (
-            pymodbus.exceptions.ModbusException,
-            asyncio.TimeoutError,
-        ) as ex:
-            self._expected_error(f"Cannot power off compressor: {str(ex)}")
-
-    async def update_status(self) -> None:
-        """Read compressor status - 3 status registers starting from address
-        0x30."""
-        assert self.model is not None
-        status = await self.model.get_status()
-
-        await self.evt_status.set_write(
-            **status_bit_to_bools(
-                [
-                    "readyToStart",
-                    "operating",
-                    "startInhibit",
-                    "motorStartPhase",
-                    "offLoad",
-                    "onLoad",
-                    "softStop",
-                    "runOnTimer",
-                    "fault",
-                    "warning",
-                    "serviceRequired",
-                    "minAllowedSpeedAchieved",
-                    "maxAllowedSpeedAchieved",
-                ],
-                status[0],
-            ),
-            **status_bit_to_bools(
-                [
-                    "startByRemote",
-                    "startWithTimerControl",
-                    "startWithPressureRequirement",
-                    "startAfterDePressurise",
-                    "startAfterPowerLoss",
-                    "startAfterDryerPreRun",
-                ],
-                status[2],
-            ),
+        """Powers off compressor."""
+        await self._run_command(
+            MTAirCompressorModel.power_off,
+            "Compressor powered off.",
+            "Cannot power off compressor",
         )
 
+    async def update_status(self, status: list[int]) -> None:
+        """Publish compressor status.
+
+        Parameters
+        ----------
+        status : `[int]`
+            3 status registers starting from address 0x30.
+        """
+        if status == self._last_status:
+            return
+
+        flags = STATUS_FIELDS.copy()
+        update_bools(flags, STATUS_MASKS, status[0])
+        update_bools(flags, START_MASKS, status[2])
+        await self.evt_status.set_write(**flags)
+
         self._start_by_remote = status[2] & 0x01 == 0x01
+        self._last_status = status
 
-    async def update_errorsWarnings(self) -> None:
-        assert self.model is not None
-        errorsWarnings = await self.model.get_error_registers()
-
-        await self.evt_errors.set_write(
-            **status_bit_to_bools(
-                [
-                    "powerSupplyFailureE400",
-                    "emergencyStopActivatedE401",
-                    "highMotorTemperatureM1E402",
-                    "compressorDischargeTemperatureE403",
-                    "startTemperatureLowE404",
-                    "dischargeOverPressureE405",
-                    "linePressureSensorB1E406",
-                    "dischargePressureSensorB2E407",
-                    "dischargeTemperatureSensorR2E408",
-                    "controllerHardwareE409",
-                    "coolingE410",
-                    "oilPressureLowE411",
-                    "externalFaultE412",
-                    "dryerE413",
-                    "condensateDrainE414",
-                    "noPressureBuildUpE415",
-                ],
-                errorsWarnings[0],
-            ),
-            **status_bit_to_bools(
-                ["heavyStartupE416"],
-                errorsWarnings[1],
-            ),
-            **status_bit_to_bools(
-                [
-                    "preAdjustmentVSDE500",
-                    "preAdjustmentE501",
-                    "lockedVSDE502",
-                    "writeFaultVSDE503",
-                    "communicationVSDE504",
-                    "stopPressedVSDE505",
-                    "stopInputEMVSDE506",
-                    "readFaultVSDE507",
-                    "stopInputVSDEME508",
-                    "seeVSDDisplayE509",
-                    "speedBelowMinLimitE510",
-                ],
-                errorsWarnings[6],
-            ),
-        )
+    async def update_errorsWarnings(self, errorsWarnings: list[int]) -> None:
+        """Publish compressor errors and warnings.
 
-        await self.evt_warnings.set_write(
-            **status_bit_to_bools(
-                [
-                    "serviceDueA600",
-                    "dischargeOverPressureA601",
-                    "compressorDischargeTemperatureA602",
-                    None,
-                    None,
-                    None,
-                    "linePressureHighA606",
-                    "controllerBatteryEmptyA607",
-                    "dryerA608",
-                    "condensateDrainA609",
-                    "fineSeparatorA610",
-                    "airFilterA611",
-                    "oilFilterA612",
-                    "oilLevelLowA613",
-                    "oilTemperatureHighA614",
-                    "externalWarningA615",
-                ],
-                errorsWarnings[8],
-            ),
-            **status_bit_to_bools(
-                [
-                    "motorLuricationSystemA616",
-                    "input1A617",
-                    "input2A618",
-                    "input3A619",
-                    "input4A620",
-                    "input5A621",
-                    "input6A622",
-                    "fullSDCardA623",
-                ],
-                errorsWarnings[9],
-            ),
-            **status_bit_to_bools(
-                ["temperatureHighVSDA700"],
-                errorsWarnings[14],
-            ),
-        )
+        Parameters
+        ----------
+        errorsWarnings : `[int]`
+            16 error and warning registers starting from address 0x63.
+        """
+        if errorsWarnings == self._last_errors_warnings:
+            return
 
-    async def update_compressor_info(self) -> None:
-        """Read compressor info - serial number and software version."""
+        errors = ERRORS_FIELDS.copy()
+        update_bools(errors, ERROR_E400_MASKS, errorsWarnings[0])
+        update_bools(errors, ERROR_E416_MASKS, errorsWarnings[1])
+        update_bools(errors, ERROR_E500_MASKS, errorsWarnings[6])
+        await self.evt_errors.set_write(**errors)
 
-        def to_string(arr: typing.Any) -> str:
-            return "".join(map(chr, arr))
+        warnings = WARNINGS_FIELDS.copy()
+        update_bools(warnings, WARNING_A600_MASKS, errorsWarnings[8])
+        update_bools(warnings, WARNING_A616_MASKS, errorsWarnings[9])
+        update_bools(warnings, WARNING_A700_MASKS, errorsWarnings[14])
+        await self.evt_warnings.set_write(**warnings)
+        self._last_errors_warnings = errorsWarnings
 
+    async def update_compressor_info(self) -> None:
+        """Read compressor info - serial number and software version."""
         assert self.model is not None
         info = await self.model.get_compressor_info()
         await self.evt_compressorInfo.set_write(
-            softwareVersion=to_string(info[0:14]),
-            serialNumber=to_string(info[14:23]),
+            softwareVersion=registers_to_string(info[0:14]),
+            serialNumber=registers_to_string(info[14:23]),
         )
+        self._compressor_info_published = True
 
-    async def update_analog_data(self) -> None:
-        """Read compressor analog (telemetry-worth) data."""
-        assert self.model is not None
-        analog = await self.model.get_analog_data()
-        # skip analog[8], Compressor power consumption, not available on the
-        # compressor
-        del analog[8]
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            analog, wordorder=Endian.BIG, byteorder=Endian.BIG
-        )
+    async def update_analog_data(self, analog: list[int]) -> None:
+        """Publish compressor analog (telemetry-worth) data.
 
+        Parameters
+        ----------
+        analog : `[int]`
+            Water level register followed by 14 registers starting from
+            address 0x22.
+        """
         await self.tel_analogData.set_write(
             force_output=True,
-            waterLevel=decoder.decode_16bit_int(),
-            targetSpeed=decoder.decode_16bit_uint(),
-            motorCurrent=decoder.decode_16bit_uint() / 10.0,
-            heatsinkTemperature=decoder.decode_16bit_int(),
-            dclinkVoltage=decoder.decode_16bit_uint(),
-            motorSpeedPercentage=decoder.decode_16bit_uint(),
-            motorSpeedRPM=decoder.decode_16bit_uint(),
-            motorInput=decoder.decode_16bit_uint() / 10.0,
-            # unavailable on LRS model - see above for analog reduction
-            # compressorPowerConsumption=decoder.decode_16bit_uint() / 10.0,
-            compressorVolumePercentage=decoder.decode_16bit_uint(),
-            compressorVolume=decoder.decode_16bit_uint() / 10.0,
-            groupVolume=decoder.decode_16bit_uint() / 10.0,
-            stage1OutputPressure=decoder.decode_16bit_int(),
-            linePressure=decoder.decode_16bit_int(),
-            stage1OutputTemperature=decoder.decode_16bit_int(),
+            waterLevel=to_int16(analog[0]),
+            targetSpeed=analog[1],
+            motorCurrent=analog[2] / 10.0,
+            heatsinkTemperature=to_int16(analog[3]),
+            dclinkVoltage=analog[4],
+            motorSpeedPercentage=analog[5],
+            motorSpeedRPM=analog[6],
+            motorInput=analog[7] / 10.0,
+            # unavailable on LRS model
+            # compressorPowerConsumption=analog[8] / 10.0,
+            compressorVolumePercentage=analog[9],
+            compressorVolume=analog[10] / 10.0,
+            groupVolume=analog[11] / 10.0,
+            stage1OutputPressure=to_int16(analog[12]),
+            linePressure=to_int16(analog[13]),
+            stage1OutputTemperature=to_int16(analog[14]),
         )
 
-    async def update_timer(self) -> None:
-        """Read compressors timers."""
-        assert self.model is not None
-        timers = await self.model.get_timers()
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            timers, wordorder=Endian.BIG, byteorder=Endian.BIG
-        )
+    async def update_timer(self, timers: list[int]) -> None:
+        """Publish compressors timers.
 
+        Parameters
+        ----------
+        timers : `[int]`
+            8 timer registers starting from address 0x39.
+        """
         await self.evt_timerInfo.set_write(
-            runningHours=decoder.decode_32bit_uint(),
-            loadedHours=decoder.decode_32bit_uint(),
-            lowestServiceCounter=decoder.decode_16bit_int(),
-            runOnTimer=decoder.decode_16bit_int(),
+            runningHours=to_uint32(timers[0], timers[1]),
+            loadedHours=to_uint32(timers[2], timers[3]),
+            lowestServiceCounter=to_int16(timers[4]),
+            runOnTimer=to_int16(timers[5]),
             # unavailable on LRS model
-            # loadedHours50Percent=decoder.decode_32bit_int()),
+            # loadedHours50Percent=to_uint32(timers[6], timers[7]),
         )
 
     async def telemetry_loop(self) -> None:
-        """Runs telemetry loop."""
-        timerUpdate = 0
+        """Runs telemetry loop.
+
+        Telemetry is read at fixed POLL_PERIOD deadlines, so time spent
+        reading and publishing doesn't add up to the period.
+        """
+        # model is replaced only after the loop ends on an exception
+        model = self.model
+        assert model is not None
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time() + POLL_PERIOD
         try:
-            while True:
-                await self.update_status()
-                await self.update_errorsWarnings()
-                await self.update_analog_data()
-
-                if timerUpdate <= 0:
-                    await self.update_timer()
-                    timerUpdate = 60
-                else:
-                    timerUpdate -= 1
+            while not self._shutdown_event.is_set():
+                block = await model.get_telemetry_block()
+
+                await self.update_status(block[STATUS_ADDRESS])
+                await self.update_errorsWarnings(block[ERROR_E400_ADDRESS])
+                await self.update_analog_data(block[WATER_LEVEL_ADDRESS])
 
-                await asyncio.sleep(1)
+                self._timers = block[RUNNING_HOURS_ADDRESS]
+                if self.timer_task.done():
+                    self.timer_task = asyncio.create_task(self.timer_loop())
+
+                now = loop.time()
+                if now > next_deadline + POLL_PERIOD:
+                    self.log.warning(
+                        "Telemetry loop overrun by "
+                        f"{now - next_deadline:.1f} seconds"
+                    )
+                    next_deadline = now + POLL_PERIOD
+                await asyncio.sleep(max(0, next_deadline - now))
+                next_deadline += POLL_PERIOD
 
         except (
             pymodbus.exceptions.ModbusException,
@@ -529,19 +643,35 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
         except Exception as ex:
             await self.fault(1, f"Error in telemetry loop: {ex}, type {type(ex)}")
 
-    async def poll_loop(self) -> None:
+        finally:
+            self.timer_task.cancel()
+
+    async def timer_loop(self) -> None:
+        """Publishes timers every TIMER_PERIOD seconds. Timers are read with
+        the rest of telemetry in telemetry_loop."""
         while True:
+            # log errors and keep the period, otherwise telemetry_loop would
+            # recreate the task and publish timers every cycle
+            try:
+                await self.update_timer(self._timers)
+            except Exception:
+                self.log.exception("Cannot publish timers")
+            await asyncio.sleep(TIMER_PERIOD)
+
+    async def poll_loop(self) -> None:
+        while not self._shutdown_event.is_set():
             try:
                 if self._failed_tai is not None:
                     if self.model is None:
                         await self.connect()
                     assert self.model is not None
-                    await self.model.get_compressor_info()
+                    await self.model.ping()
                     self.log.info(
                         "Compressor connection is back after "
                         f"{utils.current_tai() - self._failed_tai:.1f} seconds"
                     )
                     self._failed_tai = None
+                    self._reconnect_attempt = 0
                 elif self.disabled_or_enabled:
                     await self.telemetry_loop()
                 elif self.summary_state in (salobj.State.STANDBY, salobj.State.FAULT):
@@ -558,7 +688,12 @@ class MTAirCompressorCsc(salobj.ConfigurableCsc):
             ) as ex:
                 await self.log_modbus_exception(ex, "While reconnecting:")
                 await self.disconnect()
-                await asyncio.sleep(SLEEP_RECONNECT)
+                await asyncio.sleep(
+                    reconnect_delay(
+                        self._reconnect_attempt, SLEEP_RECONNECT, SLEEP_RECONNECT_MAX
+                    )
+                )
+                self._reconnect_attempt += 1
             except Exception as ex:
                 self.log.exception(f"Exception in poll loop: {str(ex)}")
                 await self.disconnect()
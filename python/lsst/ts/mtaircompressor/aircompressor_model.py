@@ -72,6 +72,35 @@ class Register(enum.IntEnum):
     RESET = 0x12D  # reset errors & warnings
 
 
+# Plain int copies of addresses used on the telemetry path, as arithmetic
+# and hashing on IntEnum members is slower than on int. Keys of
+# MTAirCompressorModel.get_telemetry_block.
+WATER_LEVEL_ADDRESS = int(Register.WATER_LEVEL)
+TARGET_SPEED_ADDRESS = int(Register.TARGET_SPEED)
+STATUS_ADDRESS = int(Register.STATUS)
+RUNNING_HOURS_ADDRESS = int(Register.RUNNING_HOURS)
+ERROR_E400_ADDRESS = int(Register.ERROR_E400)
+
+"""Number of registers read in a single request from Register.WATER_LEVEL.
+Covers water level, analog data, status and timers. Includes unmapped
+registers 0x1F-0x21 and 0x33-0x38, which the compressor wasn't yet verified
+to serve."""
+TELEMETRY_COUNT = int(Register.LOADED_HOURS_50_PERCENT) + 2 - WATER_LEVEL_ADDRESS
+
+# Position of register groups in the telemetry request
+_ANALOG_SLICE = slice(
+    TARGET_SPEED_ADDRESS - WATER_LEVEL_ADDRESS,
+    TARGET_SPEED_ADDRESS - WATER_LEVEL_ADDRESS + 14,
+)
+_STATUS_SLICE = slice(
+    STATUS_ADDRESS - WATER_LEVEL_ADDRESS, STATUS_ADDRESS - WATER_LEVEL_ADDRESS + 3
+)
+_TIMERS_SLICE = slice(
+    RUNNING_HOURS_ADDRESS - WATER_LEVEL_ADDRESS,
+    RUNNING_HOURS_ADDRESS - WATER_LEVEL_ADDRESS + 8,
+)
+
+
 class MTAirCompressorModel:
     """Model for compressor.
 
@@ -216,6 +245,16 @@ class MTAirCompressorModel:
             raise pymodbus.exceptions.ModbusException(str(result))
         return result.registers
 
+    async def ping(self) -> None:
+        """Check the compressor responds, reading a single status register.
+
+        Raises
+        ------
+        ModbusException
+            When the register cannot be retrieved.
+        """
+        await self.get_registers(STATUS_ADDRESS, 1, "Cannot ping compressor")
+
     async def get_status(self) -> list[int]:
         """Read compressor status - 3 status registers starting from address
         0x30.
@@ -273,7 +312,8 @@ class MTAirCompressorModel:
 
     async def get_analog_data(self) -> list[int]:
         """Read compressor info - register 0x1E and 14 registers starting from
-        address 0x22.
+        address 0x22. Both are read with a single request, skipping the unused
+        registers in between.
 
         Those form compressor telemetry - includes various measurements. See
         Register and Delcos manual for indices.
@@ -288,11 +328,10 @@ class MTAirCompressorModel:
         ModbusException
             When registers cannot be retrieved.
         """
-        return await self.get_registers(
-            Register.WATER_LEVEL, 1, "Cannot read water level"
-        ) + await self.get_registers(
-            Register.TARGET_SPEED, 14, "Cannot read analog data"
+        analog = await self.get_registers(
+            WATER_LEVEL_ADDRESS, _ANALOG_SLICE.stop, "Cannot read analog data"
         )
+        return analog[0:1] + analog[_ANALOG_SLICE]
 
     async def get_timers(self) -> list[int]:
         """Read compressor timers - 8 registers starting from address 0x39.
@@ -310,3 +349,38 @@ class MTAirCompressorModel:
             When registers cannot be retrieved.
         """
         return await self.get_registers(Register.RUNNING_HOURS, 8, "Cannot read timers")
+
+    async def get_telemetry_block(self) -> dict[int, list[int]]:
+        """Read all telemetry registers with the minimal number of requests.
+
+        Water level, analog data, status and timers are close enough to be
+        read with a single request starting at address 0x1E. Error registers
+        (0x63) are too far away to be included, so those are read with a
+        second request.
+
+        Returns
+        -------
+        block : `dict [int, [int]]`
+            Registers values. Keys are WATER_LEVEL_ADDRESS (the same values as
+            returned by `get_analog_data`), STATUS_ADDRESS (`get_status`),
+            RUNNING_HOURS_ADDRESS (`get_timers`) and ERROR_E400_ADDRESS
+            (`get_error_registers`).
+
+        Raises
+        ------
+        ModbusException
+            When registers cannot be retrieved.
+        """
+        telemetry = await self.get_registers(
+            WATER_LEVEL_ADDRESS, TELEMETRY_COUNT, "Cannot read telemetry"
+        )
+        errors = await self.get_registers(
+            ERROR_E400_ADDRESS, 16, "Cannot read error registers"
+        )
+
+        return {
+            WATER_LEVEL_ADDRESS: telemetry[0:1] + telemetry[_ANALOG_SLICE],
+            STATUS_ADDRESS: telemetry[_STATUS_SLICE],
+            RUNNING_HOURS_ADDRESS: telemetry[_TIMERS_SLICE],
+            ERROR_E400_ADDRESS: errors,
+        }
@@ -23,6 +23,7 @@ __all__ = ["create_server", "create_server_and_run_on_background"]
 
 import asyncio
 import socket
+import typing
 
 from pymodbus.datastore import (
     ModbusSequentialDataBlock,
@@ -33,27 +34,48 @@ from pymodbus.server.async_io import ModbusTcpServer
 
 from .aircompressor_model import Register
 
+"""Initial values of simulated holding registers."""
+HR_TEMPLATE = tuple([0] * 0x1E + list(range(1, 20)) + [0x01, 0x0, 0x01] + [0] * 0x120)
+
 
 class SimulatedHrBlock(ModbusSequentialDataBlock):
+    # there is mismatch in indexing, + 1 is needed on Register.xxx side
+    _REMOTE_CMD_ADDRESS = int(Register.REMOTE_CMD) + 1
+    _STATUS_ADDRESS = int(Register.STATUS) + 1
+    _INHIBIT_ADDRESS = int(Register.INHIBIT) + 1
+
+    # status and inhibit values after power off (index 0) and on (index 1).
+    # Registers aren't adjacent, so cannot be set with a single write
+    _STATUS_VALUES = ([0x01], [0x02])
+    _INHIBIT_VALUES = ([0x01], [0x00])
+
     def __init__(self) -> None:
-        block = [0] * 0x1E + list(range(1, 20)) + [0x01, 0x0, 0x01] + [0] * 0x120
-        super().__init__(0, block)
+        super().__init__(0, HR_TEMPLATE)
+        # side effects of writing to an address
+        self._side_effects: dict[int, typing.Callable[[list[int]], None]] = {
+            self._REMOTE_CMD_ADDRESS: self._remote_cmd
+        }
+
+    def restore_initial_values(self) -> None:
+        """Restore registers to their initial values."""
+        self.values = list(HR_TEMPLATE)
+
+    def _remote_cmd(self, values: list[int]) -> None:
+        on = int(values[0] == 0xFF01)
+        super().setValues(self._STATUS_ADDRESS, self._STATUS_VALUES[on])
+        super().setValues(self._INHIBIT_ADDRESS, self._INHIBIT_VALUES[on])
 
     def setValues(self, address: int, values: list[int]) -> None:
-        # there is mismatch in indexing, + 1 is needed on Register.xxx side
-        if address == Register.REMOTE_CMD + 1:
-            super().setValues(
-                Register.STATUS + 1, [0x02] if values[0] == 0xFF01 else [0x01]
-            )
-            super().setValues(
-                Register.INHIBIT + 1, [0x00] if values[0] == 0xFF01 else [0x01]
-            )
+        side_effect = self._side_effects.get(address)
+        if side_effect is not None:
+            side_effect(values)
         super().setValues(address, values)
 
 
 def create_server() -> ModbusTcpServer:
     """Create simulator server. Uses arbitrary constants for values, please
-    consult Delcos XL register map - see Register enum.
+    consult Delcos XL register map - see Register enum. The server listens on
+    an ephemeral port of the loopback interface.
 
     Returns
     -------
@@ -63,7 +85,7 @@ def create_server() -> ModbusTcpServer:
     store = ModbusSlaveContext(hr=SimulatedHrBlock())
     context = ModbusServerContext(slaves=store, single=True)
 
-    return ModbusTcpServer(context)
+    return ModbusTcpServer(context, address=("127.0.0.1", 0))
 
 
 async def create_server_and_run_on_background() -> tuple[
@@ -93,12 +115,12 @@ async def create_server_and_run_on_background() -> tuple[
 
     simulator_task = asyncio.create_task(server.serve_forever())
     # the resulting object shall be asyncio.SocketTransport
-    st = [s for s in server.transport.sockets if s.family == socket.AF_INET][0]
+    st = next((s for s in server.transport.sockets if s.family == socket.AF_INET), None)
     if st is None:
         raise RuntimeError(
             "The simulator cannot get data of any connected socket. Most likely "
             "the previous tests failed, leaving simulator server listening for "
             "the incoming connectons."
         )
-    host, port = socket.getnameinfo(st.getsockname(), socket.NI_NUMERICSERV)
-    return server, simulator_task, host, int(port)
+    host, port = st.getsockname()[:2]
+    return server, simulator_task, host, port
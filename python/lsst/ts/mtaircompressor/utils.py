@@ -19,7 +19,56 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["status_bit_to_bools"]
+__all__ = [
+    "bit_masks",
+    "reconnect_delay",
+    "registers_to_string",
+    "status_bit_to_bools",
+    "to_int16",
+    "to_uint32",
+    "update_bools",
+]
+
+import random
+import struct
+
+
+def bit_masks(fields: list[str | None]) -> tuple[tuple[str, int], ...]:
+    """Helper function. Precomputes masks for named bits.
+
+    Parameters
+    ----------
+    fields : `list [str]`
+        Name of fields. Corresponds to bits, with lowest (0x0001) first. Can
+        be None to specify this bit doesn't have any meaning.
+
+    Returns
+    -------
+    masks : `tuple [ tuple [ str, int ] ]`
+        Pairs of field name and bit mask, for use in `update_bools`.
+    """
+    return tuple(
+        (field, 1 << bit) for bit, field in enumerate(fields) if field is not None
+    )
+
+
+def update_bools(
+    bits: dict[str, bool], masks: tuple[tuple[str, int], ...], value: int
+) -> None:
+    """Helper function. Stores value bits as boolean fields into a map.
+
+    Parameters
+    ----------
+    bits : `dict [ str, bool ]`
+        Map to update. Keys are field names, values are set to booleans
+        corresponding to whenever that bit is set.
+    masks : `tuple [ tuple [ str, int ] ]`
+        Field names and bit masks, as returned by `bit_masks`.
+    value : `int`
+        Bit-masked value.
+    """
+    for field, mask in masks:
+        bits[field] = value & mask != 0
 
 
 def status_bit_to_bools(fields: list[str | None], value: int) -> dict[str, int]:
@@ -46,3 +95,82 @@ def status_bit_to_bools(fields: list[str | None], value: int) -> dict[str, int]:
             ret[field] = value & 0x0001
         value >>= 1
     return ret
+
+
+def to_int16(register: int) -> int:
+    """Interpret register value as signed 16-bit integer.
+
+    Parameters
+    ----------
+    register : `int`
+        Register value (0 - 0xFFFF).
+
+    Returns
+    -------
+    value : `int`
+        Signed value.
+    """
+    return register - 0x10000 if register & 0x8000 else register
+
+
+def to_uint32(high: int, low: int) -> int:
+    """Combine two registers into unsigned 32-bit integer.
+
+    Parameters
+    ----------
+    high : `int`
+        Register with the most significant word.
+    low : `int`
+        Register with the least significant word.
+
+    Returns
+    -------
+    value : `int`
+        Unsigned value.
+    """
+    return (high << 16) | low
+
+
+def registers_to_string(registers: list[int]) -> str:
+    """Decode string stored with a single character per register.
+
+    Parameters
+    ----------
+    registers : `list [int]`
+        Register values. Characters are in the low byte, the high byte is
+        ignored.
+
+    Returns
+    -------
+    string : `str`
+        Decoded string, without trailing NUL and space characters. Non-ASCII
+        characters are replaced with U+FFFD.
+    """
+    return (
+        struct.pack(f">{len(registers)}H", *registers)[1::2]
+        .decode("ascii", errors="replace")
+        .rstrip("\x00 ")
+    )
+
+
+def reconnect_delay(attempt: int, delay: float, max_delay: float) -> float:
+    """Returns delay before reconnection attempt. Grows exponentially with the
+    number of failed attempts, with a random jitter so multiple CSCs don't
+    retry in sync.
+
+    Parameters
+    ----------
+    attempt : `int`
+        Number of failed attempts so far.
+    delay : `float`
+        Delay in seconds before the first attempt.
+    max_delay : `float`
+        Maximal delay in seconds, without jitter.
+
+    Returns
+    -------
+    delay : `float`
+        Seconds to wait before the attempt, including up to a second of
+        jitter.
+    """
+    return min(max_delay, delay * 2 ** min(attempt, 4)) + random.uniform(0, 1.0)
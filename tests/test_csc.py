@@ -2,6 +2,7 @@ import pathlib
 import typing
 import unittest
 
+import pytest
 from lsst.ts import mtaircompressor, salobj
 
 CONFIG_DIR = pathlib.Path(__file__).parent / "data" / "config"
@@ -31,6 +32,53 @@ class MTAirCompressorCscTestCase(
                 enabled_commands=["powerOn", "powerOff", "reset"]
             )
 
+    async def test_telemetry(self) -> None:
+        async with self.make_csc(index=2, initial_state=salobj.State.STANDBY):
+            await salobj.set_summary_state(self.remote, salobj.State.ENABLED)
+
+            # values are from the simulator register image
+            data = await self.assert_next_sample(
+                self.remote.tel_analogData,
+                waterLevel=2,
+                targetSpeed=6,
+                heatsinkTemperature=8,
+                dclinkVoltage=9,
+                motorSpeedPercentage=10,
+                motorSpeedRPM=11,
+                compressorVolumePercentage=14,
+                stage1OutputPressure=17,
+                linePressure=18,
+                stage1OutputTemperature=19,
+            )
+            assert data.motorCurrent == pytest.approx(0.7)
+            assert data.motorInput == pytest.approx(1.2)
+            assert data.compressorVolume == pytest.approx(1.5)
+            assert data.groupVolume == pytest.approx(1.6)
+
+            await self.assert_next_sample(
+                self.remote.evt_status,
+                readyToStart=True,
+                operating=False,
+                startInhibit=False,
+                startByRemote=True,
+                startWithTimerControl=False,
+            )
+            await self.assert_next_sample(
+                self.remote.evt_timerInfo,
+                runningHours=0,
+                loadedHours=0,
+                lowestServiceCounter=0,
+                runOnTimer=0,
+            )
+
+    async def test_duplicate_index(self) -> None:
+        async with self.make_csc(index=1, initial_state=salobj.State.STANDBY):
+            with salobj.assertRaisesAckError():
+                await self.remote.cmd_start.set_start(
+                    configurationOverride="duplicate_index.yaml", timeout=60
+                )
+            assert self.csc.summary_state == salobj.State.STANDBY
+
     async def test_bin_script(self) -> None:
         await self.check_bin_script(
             name="MTAirCompressor",
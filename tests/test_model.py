@@ -1,41 +1,120 @@
+import asyncio
 import logging
+import threading
 import unittest
 
 from lsst.ts import mtaircompressor
+from lsst.ts.mtaircompressor.aircompressor_model import (
+    ERROR_E400_ADDRESS,
+    RUNNING_HOURS_ADDRESS,
+    STATUS_ADDRESS,
+    WATER_LEVEL_ADDRESS,
+)
 from pymodbus.client.tcp import AsyncModbusTcpClient as ModbusClient
+from pymodbus.server.async_io import ModbusTcpServer
 
 
 class MTAirCompressorModelTestCase(unittest.IsolatedAsyncioTestCase):
+    simulator: ModbusTcpServer
+    simulator_task: asyncio.Task
+    simulator_loop: asyncio.AbstractEventLoop
+    simulator_thread: threading.Thread
+    host: str
+    port: int
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # every test runs its own event loop, so the shared simulator runs on
+        # a dedicated event loop in a background thread
+        cls.simulator_loop = asyncio.new_event_loop()
+        cls.simulator_thread = threading.Thread(
+            target=cls.simulator_loop.run_forever, daemon=True
+        )
+        cls.simulator_thread.start()
+        cls.addClassCleanup(cls.stop_simulator_loop)
+
+        (
+            cls.simulator,
+            cls.simulator_task,
+            cls.host,
+            cls.port,
+        ) = asyncio.run_coroutine_threadsafe(
+            mtaircompressor.simulator.create_server_and_run_on_background(),
+            cls.simulator_loop,
+        ).result()
+
+        assert cls.host is not None
+        assert cls.port is not None
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        async def stop_simulator() -> None:
+            await cls.simulator.shutdown()
+            cls.simulator_task.cancel()
+            await asyncio.gather(cls.simulator_task, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(stop_simulator(), cls.simulator_loop).result()
+
+    @classmethod
+    def stop_simulator_loop(cls) -> None:
+        cls.simulator_loop.call_soon_threadsafe(cls.simulator_loop.stop)
+        cls.simulator_thread.join()
+        cls.simulator_loop.close()
+
     async def asyncSetUp(self) -> None:
         self.log = logging.getLogger()
         self.log.addHandler(logging.StreamHandler())
         self.log.setLevel(logging.INFO)
 
-        (
-            self.simulator,
-            self.simulator_task,
-            host,
-            port,
-        ) = await mtaircompressor.simulator.create_server_and_run_on_background()
+        # tests can change simulator state. Registers are restored on the
+        # simulator loop, which serves the requests
+        async def restore_registers() -> None:
+            self.simulator.context[0].store["h"].restore_initial_values()
 
-        assert host is not None
-        assert port is not None
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(restore_registers(), self.simulator_loop)
+        )
 
-        self.client = ModbusClient(host=host, port=port)
+        self.client = ModbusClient(host=self.host, port=self.port)
         assert self.client is not None
         await self.client.connect()
 
     async def asyncTearDown(self) -> None:
         assert self.client is not None
-        assert self.simulator is not None
-        await self.simulator.shutdown()
-        self.simulator_task.cancel()
+        self.client.close()
 
     async def test_get_status(self) -> None:
         model = mtaircompressor.MTAirCompressorModel(self.client, 1)
         assert await model.get_status() == [0x01, 0x00, 0x01]
 
+    async def test_power_on(self) -> None:
+        model = mtaircompressor.MTAirCompressorModel(self.client, 1)
+        await model.power_on()
+        assert await model.get_status() == [0x02, 0x00, 0x00]
+        await model.power_off()
+        assert await model.get_status() == [0x01, 0x00, 0x01]
+
+    async def test_ping(self) -> None:
+        model = mtaircompressor.MTAirCompressorModel(self.client, 1)
+        await model.ping()
+
     async def test_analog_data(self) -> None:
         model = mtaircompressor.MTAirCompressorModel(self.client, 1)
         analog_data = await model.get_analog_data()
         assert analog_data[0:10] == [2, 6, 7, 8, 9, 10, 11, 12, 13, 14]
+
+    async def test_telemetry_block(self) -> None:
+        model = mtaircompressor.MTAirCompressorModel(self.client, 1)
+        block = await model.get_telemetry_block()
+        assert block[STATUS_ADDRESS] == await model.get_status()
+        assert block[WATER_LEVEL_ADDRESS] == await model.get_analog_data()
+        assert block[RUNNING_HOURS_ADDRESS] == await model.get_timers()
+        assert block[ERROR_E400_ADDRESS] == await model.get_error_registers()
+
+    async def test_concurrent_requests(self) -> None:
+        model = mtaircompressor.MTAirCompressorModel(self.client, 1)
+        status, analog_data = await asyncio.gather(
+            model.get_status(), model.get_analog_data()
+        )
+        assert status == [0x01, 0x00, 0x01]
+        assert analog_data[0:10] == [2, 6, 7, 8, 9, 10, 11, 12, 13, 14]
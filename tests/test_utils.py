@@ -7,3 +7,44 @@ class StatusToBoolsTestCase(unittest.TestCase):
     def test_simple(self) -> None:
         bools = utils.status_bit_to_bools(["Bit 1", "Bit 2", None, "Bit 3"], 0x0D)
         assert bools == {"Bit 1": True, "Bit 2": False, "Bit 3": True}
+
+    def test_masks(self) -> None:
+        masks = utils.bit_masks(["Bit 1", "Bit 2", None, "Bit 3"])
+        assert masks == (("Bit 1", 0x01), ("Bit 2", 0x02), ("Bit 3", 0x08))
+
+    def test_update_bools(self) -> None:
+        bits = {"Bit 0": True}
+        utils.update_bools(bits, utils.bit_masks(["Bit 1", None, "Bit 3"]), 0x04)
+        assert bits == {"Bit 0": True, "Bit 1": False, "Bit 3": True}
+
+
+class DecodeTestCase(unittest.TestCase):
+    def test_to_int16(self) -> None:
+        assert utils.to_int16(0x0000) == 0
+        assert utils.to_int16(0x7FFF) == 32767
+        assert utils.to_int16(0x8000) == -32768
+        assert utils.to_int16(0xFFFF) == -1
+
+    def test_to_uint32(self) -> None:
+        assert utils.to_uint32(0x0000, 0xFFFF) == 0xFFFF
+        assert utils.to_uint32(0x0001, 0x0000) == 0x10000
+        assert utils.to_uint32(0xFFFF, 0xFFFF) == 0xFFFFFFFF
+
+    def test_registers_to_string(self) -> None:
+        assert utils.registers_to_string([0x41, 0x42, 0x20, 0x00, 0x00]) == "AB"
+        assert utils.registers_to_string([0x00, 0x41, 0x20, 0x42]) == "\x00A B"
+        # high byte is ignored
+        assert utils.registers_to_string([0x4141, 0xFF42]) == "AB"
+        assert utils.registers_to_string([0x41, 0xE9]) == "A\ufffd"
+        assert utils.registers_to_string([]) == ""
+
+
+class ReconnectDelayTestCase(unittest.TestCase):
+    def test_schedule(self) -> None:
+        for attempt, expected in enumerate([5, 10, 20, 40, 60, 60, 60]):
+            delay = utils.reconnect_delay(attempt, 5, 60)
+            assert expected <= delay <= expected + 1
+
+    def test_cap(self) -> None:
+        assert 30 <= utils.reconnect_delay(100, 5, 30) <= 31
+        assert 80 <= utils.reconnect_delay(100, 5, 100) <= 81